@@ -6,16 +6,27 @@ from __future__ import annotations
 
 import argparse
 import dataclasses
+import fnmatch
+import functools
+import itertools
 import json
 import os
 import re
 import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path, PurePath
-from typing import Any, Callable, Literal, TypeVar
+from typing import Any, Callable, ClassVar, Iterator, Literal, TypeVar
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class _Explanation:
+    explanation: str
+    fix: str
+
+
+@dataclass(frozen=True, slots=True)
 class AreaDifferentFromJDex:
     """An area with a differently-named JDex entry."""
 
@@ -23,38 +34,42 @@ class AreaDifferentFromJDex:
     jdex_name: str
     type: Literal["AREA_DIFFERENT_FROM_JDEX"] = "AREA_DIFFERENT_FROM_JDEX"
 
+    _EXPLANATION: ClassVar[_Explanation] = _Explanation(
+        explanation="An area was found, the name of which is different from its corresponding JDex entry.",
+        fix="Update the one that is incorrect.",
+    )
+
     def display(self, files: list[File]) -> str:
         """Display this particular instance of an error."""
-        return f"{_print_nest(files[0])} [JDex name: {self.jdex_name}]"
+        return _display_annotated(files, f"JDex name: {self.jdex_name}")
 
     def explain(self) -> _Explanation:
         """Explain what this error is."""
-        return _Explanation(
-            explanation="An area was found, the name of which is different from its corresponding JDex entry.",
-            fix="Update the one that is incorrect.",
-        )
+        return self._EXPLANATION
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AreaNotInJDex:
     """An area without a corresponding JDex entry."""
 
     area: str
     type: Literal["AREA_NOT_IN_JDEX"] = "AREA_NOT_IN_JDEX"
 
+    _EXPLANATION: ClassVar[_Explanation] = _Explanation(
+        explanation="An area was found in your files that is missing from your JDex.",
+        fix="Go add a corresponding entry to your JDex, or delete this if it's unused.",
+    )
+
     def display(self, files: list[File]) -> str:
         """Display this particular instance of an error."""
-        return f"{_print_nest(files[0])} [area: {_print_area(self.area)}]"
+        return _display_annotated(files, f"area: {_print_area(self.area)}")
 
     def explain(self) -> _Explanation:
         """Explain what this error is."""
-        return _Explanation(
-            explanation="An area was found in your files that is missing from your JDex.",
-            fix="Go add a corresponding entry to your JDex, or delete this if it's unused.",
-        )
+        return self._EXPLANATION
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CategoryDifferentFromJDex:
     """A category with a differently-named JDex entry."""
 
@@ -62,19 +77,21 @@ class CategoryDifferentFromJDex:
     jdex_name: str
     type: Literal["CATEGORY_DIFFERENT_FROM_JDEX"] = "CATEGORY_DIFFERENT_FROM_JDEX"
 
+    _EXPLANATION: ClassVar[_Explanation] = _Explanation(
+        explanation="A category was found, the name of which is different from its corresponding JDex entry.",
+        fix="Update the one that is incorrect.",
+    )
+
     def display(self, files: list[File]) -> str:
         """Display this particular instance of an error."""
-        return f"{_print_nest(files[0])} [JDex name: {self.jdex_name}]"
+        return _display_annotated(files, f"JDex name: {self.jdex_name}")
 
     def explain(self) -> _Explanation:
         """Explain what this error is."""
-        return _Explanation(
-            explanation="A category was found, the name of which is different from its corresponding JDex entry.",
-            fix="Update the one that is incorrect.",
-        )
+        return self._EXPLANATION
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CategoryInWrongArea:
     """A category that, by its number, has been put in the wrong area."""
 
@@ -82,117 +99,129 @@ class CategoryInWrongArea:
     file_area: str
     type: Literal["CATEGORY_IN_WRONG_AREA"] = "CATEGORY_IN_WRONG_AREA"
 
+    _EXPLANATION: ClassVar[_Explanation] = _Explanation(
+        explanation="Some categories are in the wrong area.",
+        fix="Move them into the correct area folder.",
+    )
+
     def display(self, files: list[File]) -> str:
         """Given the file's name, print the error message for it."""
-        return f"{_print_nest(files[0])} [in {_print_area(self.file_area)} but should be in {_print_area(self.category_area)}]"
+        return _display_annotated(
+            files,
+            f"in {_print_area(self.file_area)} "
+            f"but should be in {_print_area(self.category_area)}",
+        )
 
     def explain(self) -> _Explanation:
         """Explain what this error is."""
-        return _Explanation(
-            explanation="Some categories are in the wrong area.",
-            fix="Move them into the correct area folder.",
-        )
+        return self._EXPLANATION
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CategoryNotInJDex:
     """An category without a corresponding JDex entry."""
 
     category: str
     type: Literal["CATEGORY_NOT_IN_JDEX"] = "CATEGORY_NOT_IN_JDEX"
 
+    _EXPLANATION: ClassVar[_Explanation] = _Explanation(
+        explanation="A category was found in the files that is missing from the JDex.",
+        fix="Go add a corresponding entry to your JDex.",
+    )
+
     def display(self, files: list[File]) -> str:
         """Display this particular instance of an error."""
-        return f"{_print_nest(files[0])} [category: {self.category}]"
+        return _display_annotated(files, f"category: {self.category}")
 
     def explain(self) -> _Explanation:
         """Explain what this error is."""
-        return _Explanation(
-            explanation="A category was found in the files that is missing from the JDex.",
-            fix="Go add a corresponding entry to your JDex.",
-        )
+        return self._EXPLANATION
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DuplicateArea:
     """An area that has been used multiple times."""
 
     area: str
     type: Literal["DUPLICATE_AREA"] = "DUPLICATE_AREA"
 
+    _EXPLANATION: ClassVar[_Explanation] = _Explanation(
+        explanation="Duplicate areas were used.",
+        fix="Assign a new area to one of them.",
+    )
+
     def display(self, files: list[File]) -> str:
         """Display this particular instance of an error."""
-        return f"Area {_print_area(self.area)}:\n    " + "\n    ".join(
-            [_print_nest(f) for f in files],
-        )
+        return _display_grouped(f"Area {_print_area(self.area)}", files)
 
     def explain(self) -> _Explanation:
         """Explain what this error is."""
-        return _Explanation(
-            explanation="Duplicate areas were used.",
-            fix="Assign a new area to one of them.",
-        )
+        return self._EXPLANATION
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DuplicateCategory:
     """A category that has been used multiple times."""
 
     category: str
     type: Literal["DUPLICATE_CATEGORY"] = "DUPLICATE_CATEGORY"
 
+    _EXPLANATION: ClassVar[_Explanation] = _Explanation(
+        explanation="Duplicate categories were used.",
+        fix="Assign a new category to one of them.",
+    )
+
     def display(self, files: list[File]) -> str:
         """Display this particular instance of an error."""
-        return f"Category {self.category}:\n    " + "\n    ".join(
-            [_print_nest(f) for f in files],
-        )
+        return _display_grouped(f"Category {self.category}", files)
 
     def explain(self) -> _Explanation:
         """Explain what this error is."""
-        return _Explanation(
-            explanation="Duplicate categories were used.",
-            fix="Assign a new category to one of them.",
-        )
+        return self._EXPLANATION
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DuplicateId:
     """An ID that has been used multiple times."""
 
     id: str
     type: Literal["DUPLICATE_ID"] = "DUPLICATE_ID"
 
+    _EXPLANATION: ClassVar[_Explanation] = _Explanation(
+        explanation="Duplicate IDs were used.",
+        fix="Assign a new ID to one of them.",
+    )
+
     def display(self, files: list[File]) -> str:
         """Display this particular instance of an error."""
-        return f"ID {self.id}:\n    " + "\n    ".join([_print_nest(f) for f in files])
+        return _display_grouped(f"ID {self.id}", files)
 
     def explain(self) -> _Explanation:
         """Explain what this error is."""
-        return _Explanation(
-            explanation="Duplicate IDs were used.",
-            fix="Assign a new ID to one of them.",
-        )
+        return self._EXPLANATION
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileOutsideId:
     """A file was encountered not in a terminal ID folder."""
 
     type: Literal["FILE_OUTSIDE_ID"] = "FILE_OUTSIDE_ID"
 
+    _EXPLANATION: ClassVar[_Explanation] = _Explanation(
+        explanation="Files were found outside of IDs.",
+        fix="Files should only be kept in IDs and not higher in the hierarchy.",
+    )
+
     def display(self, files: list[File]) -> str:
         """Display this particular instance of an error."""
         return _print_nest(files[0])
 
     def explain(self) -> _Explanation:
         """Explain what this error is."""
-        return _Explanation(
-            explanation="Files were found outside of IDs.",
-            fix="Files should only be kept in IDs and not higher in the hierarchy.",
-        )
+        return self._EXPLANATION
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IdDifferentFromJDex:
     """An ID with a differently-named JDex entry."""
 
@@ -200,19 +229,21 @@ class IdDifferentFromJDex:
     jdex_name: str
     type: Literal["ID_DIFFERENT_FROM_JDEX"] = "ID_DIFFERENT_FROM_JDEX"
 
+    _EXPLANATION: ClassVar[_Explanation] = _Explanation(
+        explanation="An ID was found, the name of which is different from its corresponding JDex entry.",
+        fix="Update the one that is incorrect.",
+    )
+
     def display(self, files: list[File]) -> str:
         """Display this particular instance of an error."""
-        return f"{_print_nest(files[0])} [JDex name: {self.jdex_name}]"
+        return _display_annotated(files, f"JDex name: {self.jdex_name}")
 
     def explain(self) -> _Explanation:
         """Explain what this error is."""
-        return _Explanation(
-            explanation="An ID was found, the name of which is different from its corresponding JDex entry.",
-            fix="Update the one that is incorrect.",
-        )
+        return self._EXPLANATION
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IdInWrongCategory:
     """An ID that, by its number, has been put in the wrong category."""
 
@@ -220,110 +251,123 @@ class IdInWrongCategory:
     file_ac: str
     type: Literal["ID_IN_WRONG_CATEGORY"] = "ID_IN_WRONG_CATEGORY"
 
+    _EXPLANATION: ClassVar[_Explanation] = _Explanation(
+        explanation="Some IDs are in the wrong category.",
+        fix="Move them into the correct category folder.",
+    )
+
     def display(self, files: list[File]) -> str:
         """Display this particular instance of an error."""
-        return (
-            f"{_print_nest(files[0])} [in {self.file_ac} but should be in {self.id_ac}]"
+        return _display_annotated(
+            files,
+            f"in {self.file_ac} but should be in {self.id_ac}",
         )
 
     def explain(self) -> _Explanation:
         """Explain what this error is."""
-        return _Explanation(
-            explanation="Some IDs are in the wrong category.",
-            fix="Move them into the correct category folder.",
-        )
+        return self._EXPLANATION
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IdNotInJDex:
     """An ID without a corresponding JDex entry."""
 
     id: str
     type: Literal["ID_NOT_IN_JDEX"] = "ID_NOT_IN_JDEX"
 
+    _EXPLANATION: ClassVar[_Explanation] = _Explanation(
+        explanation="An ID was found in the files that is missing from the JDex.",
+        fix="Go add a corresponding entry to your JDex.",
+    )
+
     def display(self, files: list[File]) -> str:
         """Display this particular instance of an error."""
-        return f"{_print_nest(files[0])} [ID: {self.id}]"
+        return _display_annotated(files, f"ID: {self.id}")
 
     def explain(self) -> _Explanation:
         """Explain what this error is."""
-        return _Explanation(
-            explanation="An ID was found in the files that is missing from the JDex.",
-            fix="Go add a corresponding entry to your JDex.",
-        )
+        return self._EXPLANATION
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InvalidAreaName:
     """A folder at the area level that doesn't match the normal format."""
 
     type: Literal["INVALID_AREA_NAME"] = "INVALID_AREA_NAME"
 
+    _EXPLANATION: ClassVar[_Explanation] = _Explanation(
+        explanation="Some areas have invalid names.",
+        fix='Valid area names look like "10-19 Life Admin", so edit the names to match that format.',
+    )
+
     def display(self, files: list[File]) -> str:
         """Display this particular instance of an error."""
         return _print_nest(files[0])
 
     def explain(self) -> _Explanation:
         """Explain what this error is."""
-        return _Explanation(
-            explanation="Some areas have invalid names.",
-            fix='Valid area names look like "10-19 Life Admin", so edit the names to match that format.',
-        )
+        return self._EXPLANATION
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InvalidCategoryName:
     """A folder at the category level that doesn't match the normal format."""
 
     type: Literal["INVALID_CATEGORY_NAME"] = "INVALID_CATEGORY_NAME"
 
+    _EXPLANATION: ClassVar[_Explanation] = _Explanation(
+        explanation="Some categories have invalid names.",
+        fix='Valid category names look like "11 Me, Myself, & I", so edit the names to match that format.',
+    )
+
     def display(self, files: list[File]) -> str:
         """Display this particular instance of an error."""
         return _print_nest(files[0])
 
     def explain(self) -> _Explanation:
         """Explain what this error is."""
-        return _Explanation(
-            explanation="Some categories have invalid names.",
-            fix='Valid category names look like "11 Me, Myself, & I", so edit the names to match that format.',
-        )
+        return self._EXPLANATION
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InvalidIDName:
     """A folder at the ID level that doesn't match the normal format."""
 
     type: Literal["INVALID_ID_NAME"] = "INVALID_ID_NAME"
 
+    _EXPLANATION: ClassVar[_Explanation] = _Explanation(
+        explanation="Some IDs have invalid names.",
+        fix='Valid ID names look like "11.11 A Cool Project", so edit the names to match that format.',
+    )
+
     def display(self, files: list[File]) -> str:
         """Display this particular instance of an error."""
         return _print_nest(files[0])
 
     def explain(self) -> _Explanation:
         """Explain what this error is."""
-        return _Explanation(
-            explanation="Some IDs have invalid names.",
-            fix='Valid ID names look like "11.11 A Cool Project", so edit the names to match that format.',
-        )
+        return self._EXPLANATION
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NonemptyInbox:
     """An inbox (AC.01) that contains items."""
 
     num_items: int
     type: Literal["NONEMPTY_INBOX"] = "NONEMPTY_INBOX"
 
+    _EXPLANATION: ClassVar[_Explanation] = _Explanation(
+        explanation="Files were found in an inbox.",
+        fix="Go sort them into the appropriate IDs.",
+    )
+
     def display(self, files: list[File]) -> str:
         """Display this particular instance of an error."""
-        return f"{_print_nest(files[0])} [{self.num_items} items]"
+        return _display_annotated(files, f"{self.num_items} items")
 
     def explain(self) -> _Explanation:
         """Explain what this error is."""
-        return _Explanation(
-            explanation="Files were found in an inbox.",
-            fix="Go sort them into the appropriate IDs.",
-        )
+        return self._EXPLANATION
 
 
 ErrorType = (
@@ -346,7 +390,7 @@ ErrorType = (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JDexAreaHeaderDifferentFromArea:
     """An area header with a different name than the correspnoding area."""
 
@@ -356,38 +400,42 @@ class JDexAreaHeaderDifferentFromArea:
         "JDEX_AREA_HEADER_DIFFERENT_FROM_AREA"
     )
 
+    _EXPLANATION: ClassVar[_Explanation] = _Explanation(
+        explanation="An area header was found, the name of which is different from its corresponding JDex entry.",
+        fix="Update the one that is incorrect.",
+    )
+
     def display(self, files: list[File]) -> str:
         """Display this particular instance of an error."""
-        return f"{_print_nest(files[0])} [JDex name: {self.jdex_name}]"
+        return _display_annotated(files, f"JDex name: {self.jdex_name}")
 
     def explain(self) -> _Explanation:
         """Explain what this error is."""
-        return _Explanation(
-            explanation="An area header was found, the name of which is different from its corresponding JDex entry.",
-            fix="Update the one that is incorrect.",
-        )
+        return self._EXPLANATION
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JDexAreaHeaderWithoutArea:
     """An area header with no corresponding area."""
 
     area: str
     type: Literal["JDEX_AREA_HEADER_WITHOUT_AREA"] = "JDEX_AREA_HEADER_WITHOUT_AREA"
 
+    _EXPLANATION: ClassVar[_Explanation] = _Explanation(
+        explanation="An area header was found in the JDex with no corresponding area entry.",
+        fix="Go add a corresponding entry to your JDex, or delete this header if it is no longer needed.",
+    )
+
     def display(self, files: list[File]) -> str:
         """Display this particular instance of an error."""
-        return f"{_print_nest(files[0])} [area: {_print_area(self.area)}]"
+        return _display_annotated(files, f"area: {_print_area(self.area)}")
 
     def explain(self) -> _Explanation:
         """Explain what this error is."""
-        return _Explanation(
-            explanation="An area header was found in the JDex with no corresponding area entry.",
-            fix="Go add a corresponding entry to your JDex, or delete this header if it is no longer needed.",
-        )
+        return self._EXPLANATION
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JDexCategoryInWrongArea:
     """A JDex category that, by its number, has been put in the wrong area."""
 
@@ -395,119 +443,129 @@ class JDexCategoryInWrongArea:
     file_area: str
     type: Literal["JDEX_CATEGORY_IN_WRONG_AREA"] = "JDEX_CATEGORY_IN_WRONG_AREA"
 
+    _EXPLANATION: ClassVar[_Explanation] = _Explanation(
+        explanation="Some JDex categories are in the wrong area.",
+        fix="Move them into the correct area folder, or use a flat JDex structure.",
+    )
+
     def display(self, files: list[File]) -> str:
         """Given the file's name, print the error message for it."""
-        return f"{_print_nest(files[0])} [in {_print_area(self.file_area)} but should be in {_print_area(self.category_area)}]"
+        return _display_annotated(
+            files,
+            f"in {_print_area(self.file_area)} "
+            f"but should be in {_print_area(self.category_area)}",
+        )
 
     def explain(self) -> _Explanation:
         """Explain what this error is."""
-        return _Explanation(
-            explanation="Some JDex categories are in the wrong area.",
-            fix="Move them into the correct area folder, or use a flat JDex structure.",
-        )
+        return self._EXPLANATION
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JDexDuplicateArea:
     """A JDex area that has been used multiple times."""
 
     area: str
     type: Literal["JDEX_DUPLICATE_AREA"] = "JDEX_DUPLICATE_AREA"
 
+    _EXPLANATION: ClassVar[_Explanation] = _Explanation(
+        explanation="Duplicate areas were used in the JDex.",
+        fix="Assign a new area to one of them.",
+    )
+
     def display(self, files: list[File]) -> str:
         """Display this particular instance of an error."""
-        return f"Area {_print_area(self.area)}:\n    " + "\n    ".join(
-            [_print_nest(f) for f in files],
-        )
+        return _display_grouped(f"Area {_print_area(self.area)}", files)
 
     def explain(self) -> _Explanation:
         """Explain what this error is."""
-        return _Explanation(
-            explanation="Duplicate areas were used in the JDex.",
-            fix="Assign a new area to one of them.",
-        )
+        return self._EXPLANATION
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JDexDuplicateAreaHeader:
     """Multiple headers for the same area."""
 
     area: str
     type: Literal["JDEX_DUPLICATE_AREA_HEADER"] = "JDEX_DUPLICATE_AREA_HEADER"
 
+    _EXPLANATION: ClassVar[_Explanation] = _Explanation(
+        explanation="Duplicate headers were found for the same area in the JDex.",
+        fix="Delete the one that is incorrect or fix the area number.",
+    )
+
     def display(self, files: list[File]) -> str:
         """Display this particular instance of an error."""
-        return f"Area {_print_area(self.area)}:\n    " + "\n    ".join(
-            [_print_nest(f) for f in files],
-        )
+        return _display_grouped(f"Area {_print_area(self.area)}", files)
 
     def explain(self) -> _Explanation:
         """Explain what this error is."""
-        return _Explanation(
-            explanation="Duplicate headers were found for the same area in the JDex.",
-            fix="Delete the one that is incorrect or fix the area number.",
-        )
+        return self._EXPLANATION
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JDexDuplicateCategory:
     """A JDex category that has been used multiple times."""
 
     category: str
     type: Literal["JDEX_DUPLICATE_CATEGORY"] = "JDEX_DUPLICATE_CATEGORY"
 
+    _EXPLANATION: ClassVar[_Explanation] = _Explanation(
+        explanation="Duplicate categories were used in the JDex.",
+        fix="Assign a new category to one of them.",
+    )
+
     def display(self, files: list[File]) -> str:
         """Display this particular instance of an error."""
-        return (
-            self.category + ":\n    " + "\n    ".join([_print_nest(f) for f in files])
-        )
+        return _display_grouped(self.category, files)
 
     def explain(self) -> _Explanation:
         """Explain what this error is."""
-        return _Explanation(
-            explanation="Duplicate categories were used in the JDex.",
-            fix="Assign a new category to one of them.",
-        )
+        return self._EXPLANATION
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JDexDuplicateId:
     """A JDex ID that has been used multiple times."""
 
     id: str
     type: Literal["JDEX_DUPLICATE_ID"] = "JDEX_DUPLICATE_ID"
 
+    _EXPLANATION: ClassVar[_Explanation] = _Explanation(
+        explanation="Duplicate IDs were used in the JDex.",
+        fix="Assign a new ID to one of them.",
+    )
+
     def display(self, files: list[File]) -> str:
         """Display this particular instance of an error."""
-        return self.id + ":\n    " + "\n    ".join([_print_nest(f) for f in files])
+        return _display_grouped(self.id, files)
 
     def explain(self) -> _Explanation:
         """Explain what this error is."""
-        return _Explanation(
-            explanation="Duplicate IDs were used in the JDex.",
-            fix="Assign a new ID to one of them.",
-        )
+        return self._EXPLANATION
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JDexFileOutsideCategory:
     """A JDex file was encountered not in a terminal category folder."""
 
     type: Literal["JDEX_FILE_OUTSIDE_CATEGORY"] = "JDEX_FILE_OUTSIDE_CATEGORY"
 
+    _EXPLANATION: ClassVar[_Explanation] = _Explanation(
+        explanation="JDex files were found outside of categories in a nested structure.",
+        fix="JDex files should be entirely flat, or nested under area then category.",
+    )
+
     def display(self, files: list[File]) -> str:
         """Display this particular instance of an error."""
         return _print_nest(files[0])
 
     def explain(self) -> _Explanation:
         """Explain what this error is."""
-        return _Explanation(
-            explanation="JDex files were found outside of categories in a nested structure.",
-            fix="JDex files should be entirely flat, or nested under area then category.",
-        )
+        return self._EXPLANATION
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JDexIdInWrongCategory:
     """A JDex ID that, by its number, has been put in the wrong category."""
 
@@ -515,72 +573,81 @@ class JDexIdInWrongCategory:
     file_ac: str
     type: Literal["JDEX_ID_IN_WRONG_CATEGORY"] = "JDEX_ID_IN_WRONG_CATEGORY"
 
+    _EXPLANATION: ClassVar[_Explanation] = _Explanation(
+        explanation="Some JDex IDs are in the wrong category.",
+        fix="Move them into the correct category folder, or use a flat JDex structure.",
+    )
+
     def display(self, files: list[File]) -> str:
         """Display this particular instance of an error."""
-        return (
-            f"{_print_nest(files[0])} [in {self.file_ac} but should be in {self.id_ac}]"
+        return _display_annotated(
+            files,
+            f"in {self.file_ac} but should be in {self.id_ac}",
         )
 
     def explain(self) -> _Explanation:
         """Explain what this error is."""
-        return _Explanation(
-            explanation="Some JDex IDs are in the wrong category.",
-            fix="Move them into the correct category folder, or use a flat JDex structure.",
-        )
+        return self._EXPLANATION
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JDexInvalidAreaName:
     """A folder at the JDex area level that doesn't match the normal format."""
 
     type: Literal["JDEX_INVALID_AREA_NAME"] = "JDEX_INVALID_AREA_NAME"
 
+    _EXPLANATION: ClassVar[_Explanation] = _Explanation(
+        explanation="Some JDex areas have invalid names.",
+        fix='Valid area names look like "10-19 Life Admin", so edit the names to match that format.',
+    )
+
     def display(self, files: list[File]) -> str:
         """Display this particular instance of an error."""
         return _print_nest(files[0])
 
     def explain(self) -> _Explanation:
         """Explain what this error is."""
-        return _Explanation(
-            explanation="Some JDex areas have invalid names.",
-            fix='Valid area names look like "10-19 Life Admin", so edit the names to match that format.',
-        )
+        return self._EXPLANATION
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JDexInvalidCategoryName:
     """A folder at the JDex category level that doesn't match the normal format."""
 
     type: Literal["JDEX_INVALID_CATEGORY_NAME"] = "JDEX_INVALID_CATEGORY_NAME"
 
+    _EXPLANATION: ClassVar[_Explanation] = _Explanation(
+        explanation="Some JDex categories have invalid names.",
+        fix='Valid category names look like "11 Me, Myself, & I", so edit the names to match that format.',
+    )
+
     def display(self, files: list[File]) -> str:
         """Display this particular instance of an error."""
         return _print_nest(files[0])
 
     def explain(self) -> _Explanation:
         """Explain what this error is."""
-        return _Explanation(
-            explanation="Some JDex categories have invalid names.",
-            fix='Valid category names look like "11 Me, Myself, & I", so edit the names to match that format.',
-        )
+        return self._EXPLANATION
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JDexInvalidIDName:
     """A JDex note that doesn't match the normal format."""
 
     type: Literal["JDEX_INVALID_ID_NAME"] = "JDEX_INVALID_ID_NAME"
 
+    _EXPLANATION: ClassVar[_Explanation] = _Explanation(
+        explanation="Some JDex IDs have invalid names.",
+        fix='Valid ID names look like "11.11 A Cool Project", so edit the names to match that format.',
+    )
+
     def display(self, files: list[File]) -> str:
         """Display this particular instance of an error."""
         return _print_nest(files[0])
 
     def explain(self) -> _Explanation:
         """Explain what this error is."""
-        return _Explanation(
-            explanation="Some JDex IDs have invalid names.",
-            fix='Valid ID names look like "11.11 A Cool Project", so edit the names to match that format.',
-        )
+        return self._EXPLANATION
 
 
 JDexErrorType = (
@@ -598,23 +665,36 @@ JDexErrorType = (
     | JDexInvalidIDName
 )
 
+# The field-less errors are all equal to one another, so share one instance of
+# each rather than building a new one per violation.
+_FILE_OUTSIDE_ID = FileOutsideId()
+_INVALID_AREA_NAME = InvalidAreaName()
+_INVALID_CATEGORY_NAME = InvalidCategoryName()
+_INVALID_ID_NAME = InvalidIDName()
+_JDEX_FILE_OUTSIDE_CATEGORY = JDexFileOutsideCategory()
+_JDEX_INVALID_AREA_NAME = JDexInvalidAreaName()
+_JDEX_INVALID_CATEGORY_NAME = JDexInvalidCategoryName()
+_JDEX_INVALID_ID_NAME = JDexInvalidIDName()
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class File:
     """A file or folder that has been detected by jdlint."""
 
     name: str
     full_path: str
-    nested_under: list[str]
+    nested_under: tuple[str, ...]
 
 
-@dataclass(frozen=True)
-class _Explanation:
-    explanation: str
-    fix: str
+@dataclass(frozen=True, slots=True)
+class Uses:
+    """Every use of one area, category, or ID number: the names and files using it."""
+
+    names: list[str]
+    files: list[File]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Error:
     """A single error detected."""
 
@@ -634,7 +714,7 @@ class Error:
         return self.error.explain()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JDexError:
     """A single error detected in the JDex."""
 
@@ -654,25 +734,25 @@ class JDexError:
         return self.error.explain()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LintResults:
     """All errors returned from linting files, as well as dictionaries of all areas, categories, and IDs used (and their names)."""
 
     errors: list[Error]
-    used_areas: dict[str, list[tuple[str, File]]]
-    used_categories: dict[str, list[tuple[str, File]]]
-    used_ids: dict[str, list[tuple[str, File]]]
+    used_areas: dict[str, Uses]
+    used_categories: dict[str, Uses]
+    used_ids: dict[str, Uses]
 
 
-@dataclass
+@dataclass(slots=True)
 class _JDexAccumulator:
     """Accumulator used by _get_jdex_entries to gather information about the JDex."""
 
     errors: list[JDexError]
-    areas: dict[str, list[tuple[str, File]]]
-    categories: dict[str, list[tuple[str, File]]]
-    ids: dict[str, list[tuple[str, File]]]
-    headers: dict[str, list[tuple[str, File]]]
+    areas: dict[str, Uses]
+    categories: dict[str, Uses]
+    ids: dict[str, Uses]
+    headers: dict[str, Uses]
 
     def __init__(self) -> None:
         self.errors = []
@@ -681,8 +761,16 @@ class _JDexAccumulator:
         self.ids = {}
         self.headers = {}
 
+    def extend(self, other: _JDexAccumulator) -> None:
+        """Append everything gathered by another accumulator to this one."""
+        self.errors.extend(other.errors)
+        _merge_uses(self.areas, other.areas)
+        _merge_uses(self.categories, other.categories)
+        _merge_uses(self.ids, other.ids)
+        _merge_uses(self.headers, other.headers)
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _JDexResults:
     """Canonical results from the JDex, featuring the ID and name of each area/category/ID."""
 
@@ -691,70 +779,196 @@ class _JDexResults:
     ids: dict[str, str]
 
 
+@functools.cache
+def _field_names(cls: type) -> tuple[str, ...]:
+    """Return the names of a dataclass's fields, looking them up only once per class."""
+    return tuple(f.name for f in dataclasses.fields(cls))
+
+
 class _EnhancedJSONEncoder(json.JSONEncoder):
     def default(self, o: object) -> object:
         # Add JSON encoding for dataclasses and paths
-        if dataclasses.is_dataclass(o):
-            return dataclasses.asdict(o)  # type: ignore[arg-type]
+        if dataclasses.is_dataclass(o) and not isinstance(o, type):
+            # Only go one level deep; the encoder will call back in for nested
+            # dataclasses, so there's no need for `asdict()` to deep-copy everything
+            return {name: getattr(o, name) for name in _field_names(type(o))}
         if isinstance(o, PurePath):
             return str(o)
         return super().default(o)
 
 
-def _sort_error(e: Error | JDexError) -> tuple[str, list[tuple[list[str], str]]]:
+def _sort_error(e: Error | JDexError) -> tuple[str | tuple[tuple[str, ...], str], ...]:
     # Sort errors alphabetically by type, then by file/s affected
-    return (
-        e.error.type,
-        [_sort_file(f) for f in e.files],
-    )
+    # (A flat tuple orders the same as a nested list of files, without allocating one)
+    return (e.error.type, *map(_sort_file, e.files))
 
 
-def _sort_file(f: File) -> tuple[list[str], str]:
+def _sort_file(f: File) -> tuple[tuple[str, ...], str]:
     # Sort files first by degree of nesting, then alphabetically
     return (f.nested_under, f.name)
 
 
-# Any valid area folder name
-valid_area_re = re.compile("([0-9])0-(?:\\1)9 (.+)")
-# Any valid category folder name
-generic_category_re = re.compile("([0-9])[0-9] .+")
-# Any valid ID folder name
-generic_id_re = re.compile("([0-9][0-9])\\.([0-9][0-9]) (.+)")
-# Matches only IDs that are inboxes
-inbox_re = re.compile("[0-9][0-9]\\.01 .+")
-
-
-def _valid_category_re(a: str) -> re.Pattern:
-    """Match only valid categories for a given area."""
-    return re.compile("(" + a + "[0-9]) (.+)")
-
-
-def _valid_id_re(ac: str) -> re.Pattern:
-    """Match only valid IDs for a given area and category."""
-    return re.compile("(" + ac + "\\.[0-9][0-9]) (.+)")
+# Folder names have a rigid layout, so they are checked positionally rather than with
+# regexes; this is the hottest path when walking a large tree. (`str.isdigit()` isn't
+# used since it also accepts non-ASCII digits.)
+_DIGITS = "0123456789"
+
+
+def _parse_area(name: str) -> tuple[str, str] | None:
+    """Split a valid area name, e.g. "10-19 Life Admin", into number ("1") and title."""
+    if (
+        len(name) > 6  # noqa: PLR2004
+        and name[0] in _DIGITS
+        and name[1] == "0"
+        and name[2] == "-"
+        and name[3] == name[0]
+        and name[4] == "9"
+        and name[5] == " "
+        and "\n" not in name
+    ):
+        return (name[0], name[6:])
+    return None
+
+
+def _parse_category(name: str) -> tuple[str, str] | None:
+    """Split any category name, e.g. "11 Me, Myself, & I", into its number and title."""
+    if (
+        len(name) > 3  # noqa: PLR2004
+        and name[0] in _DIGITS
+        and name[1] in _DIGITS
+        and name[2] == " "
+        and "\n" not in name
+    ):
+        return (name[:2], name[3:])
+    return None
+
+
+def _parse_id(name: str) -> tuple[str, str] | None:
+    """Split any ID name, e.g. "11.11 A Cool Project", into its number and title."""
+    if (
+        len(name) > 6  # noqa: PLR2004
+        and name[0] in _DIGITS
+        and name[1] in _DIGITS
+        and name[2] == "."
+        and name[3] in _DIGITS
+        and name[4] in _DIGITS
+        and name[5] == " "
+        and "\n" not in name
+    ):
+        return (name[:5], name[6:])
+    return None
+
+
+def _parse_jdex_note_id(name: str) -> tuple[str, str] | None:
+    """Split any ID note name, e.g. "11.11 A Cool Project.md", into number and title."""
+    parsed_id = _parse_id(name)
+    if parsed_id:
+        return (parsed_id[0], _strip_note_extension(parsed_id[1]))
+    return None
+
+
+def _parse_jdex_note_header(name: str) -> tuple[str, str] | None:
+    """Split an area header note name, e.g. "10. Admin.md", into number and title."""
+    if (
+        len(name) > 4  # noqa: PLR2004
+        and name[0] in _DIGITS
+        and name[1] == "0"
+        and name[2] == "."
+        and name[3] == " "
+        and "\n" not in name
+    ):
+        return (name[0], _strip_note_extension(name[4:]))
+    return None
+
+
+def _strip_note_extension(title: str) -> str:
+    """Remove a ".md" extension from a note title, unless that would leave it empty."""
+    return title.removesuffix(".md") or title
+
+
+# Match area JDex notes
+jdex_note_area_re = re.compile(
+    r"([0-9])0\.00 (.+?)(?: area management)?(?: index)?(?:\.md)?",
+    flags=re.IGNORECASE,
+)
+# Match area JDex notes with the alternative standard zeros layout
+jdex_note_area_alt_zeros_re = re.compile(
+    r"0([0-9])\.00 (.+?)(?: area management)?(?: index)?(?:\.md)?",
+    flags=re.IGNORECASE,
+)
+# Match category JDex notes
+jdex_note_category_re = re.compile(
+    r"([0-9][1-9])\.00 (.+?)(?: category management)?(?: index)?(?:\.md)?",
+    flags=re.IGNORECASE,
+)
+# Match category JDex notes with the alternative standard zeros layout
+jdex_note_category_alt_zeros_re = re.compile(
+    # We need to tolerate the "area management" suffix for a category as well, to create categories from e.g. `01.00 Life Admin Area Management`
+    r"([0-9][0-9])\.00 (.+?)(?: (?:category|area) management)?(?: index)?(?:\.md)?",
+    flags=re.IGNORECASE,
+)
 
 
-# Match area header JDex notes
-jdex_note_header_re = re.compile("([0-9])0\\. (.+?)(\\.md)?")
-# Match any valid ID JDex note
-jdex_note_generic_id_re = re.compile("([0-9][0-9])\\.([0-9][0-9]) (.+?)(\\.md)?")
+# Matches JDex areas, categories, and ids in a single-file format; which one matched is
+# given by the match's `lastgroup`
+jdex_line_re = re.compile(
+    r"(?:(?P<area>(?P<area_num>[0-9])0-(?P=area_num)9 (?P<area_name>.+?))"
+    r"|(?P<category>(?P<category_num>[0-9][0-9]) (?P<category_name>.+?))"
+    r"|(?P<id>(?P<id_num>[0-9][0-9].[0-9][0-9]) (?P<id_name>.+?)))"
+    r"\s*(?://.*)?",
+)
 
 
-def _jdex_note_id_re(ac: str) -> re.Pattern:
-    """Match only valid JDex note IDs for a given area and category."""
-    return re.compile("(" + ac + "\\.[0-9][0-9]) (.+?)(\\.md)?")
+# A precompiled ignore pattern, with one regex per path component, last component first
+_IgnorePattern = tuple[re.Pattern, ...]
+
+
+def _compile_ignored(ignored: list[str] | None) -> list[_IgnorePattern]:
+    """Compile ignore patterns once, instead of `PurePath.match()` re-parsing them."""
+    # Match case-insensitively where PurePath would
+    flags = re.IGNORECASE if os.name == "nt" else 0
+    compiled = []
+    # Patterns with a single component only ever look at the file name, so they can all
+    # be checked at once with a single regex
+    single_parts = []
+    for pattern in ignored or []:
+        pattern_path = PurePath(pattern)
+        if not pattern_path.parts:
+            msg = "empty pattern"
+            raise ValueError(msg)
+        if pattern_path.anchor:
+            # Only relative paths are ever checked, so anchored patterns can't match
+            continue
+        if len(pattern_path.parts) == 1:
+            single_parts.append(fnmatch.translate(pattern_path.parts[0]))
+            continue
+        compiled.append(
+            tuple(
+                re.compile(fnmatch.translate(part), flags)
+                for part in reversed(pattern_path.parts)
+            ),
+        )
+    if single_parts:
+        compiled.insert(0, (re.compile("|".join(single_parts), flags),))
+    return compiled
 
 
 def _entry_is_ignored(
-    ignored: list[str] | None,
-    nested_under: list[str],
+    ignored: list[_IgnorePattern],
+    nested_under: tuple[str, ...],
     f: os.DirEntry,
 ) -> bool:
-    """Check if a given file/directory should be ignored."""
+    """Check if a file/directory should be ignored, matching like `PurePath.match()`."""
     if not ignored:
         return False
-    p = PurePath(*nested_under, f.name)
-    return any(p.match(pattern) for pattern in ignored)
+    parts = [*nested_under, f.name]
+    return any(
+        len(pattern) <= len(parts)
+        and all(
+            p.match(part) for p, part in zip(pattern, reversed(parts), strict=False)
+        )
+        for pattern in ignored
+    )
 
 
 E = TypeVar("E")
@@ -763,57 +977,83 @@ E = TypeVar("E")
 def _error_if_dups(  # Python's types are horrid and it just is awful to try to type this better
     make_error_type: Callable[[str], Any],
     make_error: Callable[[Any, list[File]], E],
-    d: dict[str, list[tuple[Any, File]]],
-) -> list[E]:
-    return [
-        make_error(
-            make_error_type(k),
-            sorted([file for (_, file) in v], key=_sort_file),
-        )
+    d: dict[str, Uses],
+) -> Iterator[E]:
+    return (
+        make_error(make_error_type(k), sorted(v.files, key=_sort_file))
         for k, v in d.items()
-        if len(v) > 1
-    ]
+        if len(v.files) > 1
+    )
 
 
-def _insert_append(k, v, d) -> None:  # noqa: ANN001
-    """Add value as a singleton if it's not already in the dict, else append it to the list."""
-    if k not in d:
-        d.update({k: []})
+R = TypeVar("R")
 
-    d[k].append(v)
+
+def _map_areas(
+    f: Callable[[os.DirEntry], R],
+    areas: list[os.DirEntry],
+    *,
+    jobs: int = 1,
+) -> Iterator[R]:
+    """Apply a function to every area, yielding the results in directory order."""
+    if jobs <= 1 or len(areas) <= 1:
+        # Threads only pay off when directory I/O is slow (e.g. a network file system)
+        # and are a net loss on a warm local disk, so stay serial unless asked not to
+        yield from map(f, areas)
+        return
+    # Yield in directory order, so that results don't depend on scheduling
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        yield from pool.map(f, areas)
+
+
+def _insert_use(k: str, name: str, file: File, d: dict[str, Uses]) -> None:
+    """Record a use of a number, creating its entry if it's not already in the dict."""
+    # Numbers are looked up again in the other system's dicts, so intern them to keep
+    # those lookups to a pointer comparison
+    k = sys.intern(k)
+    uses = d.get(k)
+    if uses is None:
+        uses = d[k] = Uses(names=[], files=[])
+
+    uses.names.append(name)
+    uses.files.append(file)
+
+
+def _merge_uses(d: dict[str, Uses], other: dict[str, Uses]) -> None:
+    """Add all uses from another dict of uses to this one, after those already here."""
+    for k, uses in other.items():
+        if k in d:
+            d[k].names.extend(uses.names)
+            d[k].files.extend(uses.files)
+        else:
+            d[k] = uses
 
 
 def _process_single_file_jdex(path: Path) -> _JDexResults:
     """Process a JDex located in a single file."""
-    # Matches JDex areas in a single-file format
-    jdex_line_area_re = re.compile("([0-9])0-(?:\\1)9 (.+?)\\s*(//.*)?")
-    # Matches JDex categories in a single-file format
-    jdex_line_category_re = re.compile("([0-9][0-9]) (.+?)\\s*(//.*)?")
-    # Matches JDex ids in a single-file format
-    jdex_line_id_re = re.compile("([0-9][0-9].[0-9][0-9]) (.+?)\\s*(//.*)?")
-
     file_areas = {}
     file_categories = {}
     file_ids = {}
 
-    with path.open() as jdex_it:
-        for entry in jdex_it:
-            area_match = jdex_line_area_re.fullmatch(entry.strip())
-            if area_match:
-                file_areas[area_match.group(1)] = (
-                    f"{area_match.group(1)}0-09 {area_match.group(2)}"
-                )
-                continue
-            category_match = jdex_line_category_re.fullmatch(entry.strip())
-            if category_match:
-                file_categories[category_match.group(1)] = (
-                    f"{category_match.group(1)} {category_match.group(2)}"
-                )
-                continue
-            id_match = jdex_line_id_re.fullmatch(entry.strip())
-            if id_match:
-                file_ids[id_match.group(1)] = f"{id_match.group(1)} {id_match.group(2)}"
-                continue
+    # Read the whole file at once; split only on "\n" (not splitlines()) to get the same
+    # lines as iterating over the file would
+    for entry in path.read_text().split("\n"):
+        line_match = jdex_line_re.fullmatch(entry.strip())
+        if not line_match:
+            continue
+        kind = line_match.lastgroup
+        if kind == "area":
+            file_areas[sys.intern(line_match["area_num"])] = (
+                f"{line_match['area_num']}0-09 {line_match['area_name']}"
+            )
+        elif kind == "category":
+            file_categories[sys.intern(line_match["category_num"])] = (
+                f"{line_match['category_num']} {line_match['category_name']}"
+            )
+        else:
+            file_ids[sys.intern(line_match["id_num"])] = (
+                f"{line_match['id_num']} {line_match['id_name']}"
+            )
     return _JDexResults(
         areas=file_areas,
         categories=file_categories,
@@ -825,70 +1065,59 @@ def _process_flat_jdex_structure(
     files: list[os.DirEntry],
     jdex: _JDexAccumulator,
     *,
-    ignored: list[str] | None,
+    ignored: list[_IgnorePattern],
     alt_zeros: bool = False,
 ) -> None:
     """Process a JDex that is a series of flat files."""
-    area_re = re.compile(
-        "0([0-9])\\.00 (.+?)( area management)?( index)?(\\.md)?"
-        if alt_zeros
-        else "([0-9])0\\.00 (.+?)( area management)?( index)?(\\.md)?",
-        flags=re.IGNORECASE,
-    )
-    category_re = re.compile(
-        # We need to tolerate the "area management" suffix for a category as well, to create categories from e.g. `01.00 Life Admin Area Management`
-        "([0-9][0-9])\\.00 (.+?)( (category|area) management)?( index)?(\\.md)?"
-        if alt_zeros
-        else "([0-9][1-9])\\.00 (.+?)( category management)?( index)?(\\.md)?",
-        flags=re.IGNORECASE,
+    area_re = jdex_note_area_alt_zeros_re if alt_zeros else jdex_note_area_re
+    category_re = (
+        jdex_note_category_alt_zeros_re if alt_zeros else jdex_note_category_re
     )
 
     for jid in files:
-        if _entry_is_ignored(ignored, [], jid):
+        if _entry_is_ignored(ignored, (), jid):
             continue
 
-        file = File(name=jid.name, full_path=jid.path, nested_under=[])
-
-        # Check if the file matches an area
-        area_match = area_re.fullmatch(jid.name)
-        if area_match:
-            _insert_append(
-                area_match.group(1),
-                (area_match.group(2), file),
-                jdex.areas,
-            )
+        file = File(name=jid.name, full_path=jid.path, nested_under=())
+
+        # Every area and category note is also a valid ID (AC.00), so match IDs first
+        # and only look for areas and categories among those
+        parsed_id = _parse_jdex_note_id(jid.name)
+        if not parsed_id:
+            # Check if it's a header match for alt zeros
+            parsed_header = _parse_jdex_note_header(jid.name)
+            if parsed_header:
+                (header_num, header_name) = parsed_header
+                _insert_use(header_num, header_name, file, jdex.headers)
+            else:
+                jdex.errors.append(
+                    JDexError(error=_JDEX_INVALID_ID_NAME, files=[file]),
+                )
+            continue
 
-        # Check if the file matches a category
-        cat_match = category_re.fullmatch(jid.name)
-        if cat_match:
-            _insert_append(
-                cat_match.group(1),
-                (cat_match.group(2), file),
-                jdex.categories,
-            )
+        (id_num, id_name) = parsed_id
+        if id_num[3:] == "00":
+            # Check if the file matches an area
+            area_match = area_re.fullmatch(jid.name)
+            if area_match:
+                _insert_use(
+                    area_match.group(1),
+                    area_match.group(2),
+                    file,
+                    jdex.areas,
+                )
 
-        # Check if it's a header match for alt zeros
-        header_match = jdex_note_header_re.fullmatch(jid.name)
-        if header_match:
-            _insert_append(
-                header_match.group(1),
-                (header_match.group(2), file),
-                jdex.headers,
-            )
-            continue
+            # Check if the file matches a category
+            cat_match = category_re.fullmatch(jid.name)
+            if cat_match:
+                _insert_use(
+                    cat_match.group(1),
+                    cat_match.group(2),
+                    file,
+                    jdex.categories,
+                )
 
-        # The file should also be a valid ID (or is bad)
-        id_match = jdex_note_generic_id_re.fullmatch(jid.name)
-        if id_match:
-            _insert_append(
-                f"{id_match.group(1)}.{id_match.group(2)}",
-                (id_match.group(3), file),
-                jdex.ids,
-            )
-        else:
-            jdex.errors.append(
-                JDexError(error=JDexInvalidIDName(), files=[file]),
-            )
+        _insert_use(id_num, id_name, file, jdex.ids)
 
 
 def _process_nested_jdex_structure(
@@ -896,105 +1125,119 @@ def _process_nested_jdex_structure(
     jdex: _JDexAccumulator,
     root_level_files: list[os.DirEntry],
     *,
-    ignored: list[str] | None,
+    ignored: list[_IgnorePattern],
+    jobs: int,
 ) -> None:
-    for area in os.scandir(path):
-        if _entry_is_ignored(ignored, [], area):
-            continue
-        if area.is_file():
-            # Maybe we have a flat structure
-            root_level_files.append(area)
-            continue
+    areas: list[os.DirEntry] = []
+    with os.scandir(path) as areas_it:
+        for area in areas_it:
+            if _entry_is_ignored(ignored, (), area):
+                continue
+            if area.is_file():
+                # Maybe we have a flat structure
+                root_level_files.append(area)
+                continue
 
-        # Otherwise, a directory, so nested structure
-        area_file = File(name=area.name, full_path=area.path, nested_under=[])
-        area_match = valid_area_re.fullmatch(area.name)
-        if not area_match:
-            jdex.errors.append(
-                JDexError(error=JDexInvalidAreaName(), files=[area_file]),
-            )
-            continue
-        _insert_append(
-            area_match.group(1),
-            (area_match.group(2), area_file),
-            jdex.areas,
+            # Otherwise, a directory, so nested structure
+            areas.append(area)
+
+    for area_jdex in _map_areas(
+        functools.partial(_process_nested_jdex_area, ignored=ignored),
+        areas,
+        jobs=jobs,
+    ):
+        jdex.extend(area_jdex)
+
+
+def _process_nested_jdex_area(
+    area: os.DirEntry,
+    *,
+    ignored: list[_IgnorePattern],
+) -> _JDexAccumulator:
+    """Process a single area folder of a nested JDex."""
+    jdex = _JDexAccumulator()
+    area_file = File(name=area.name, full_path=area.path, nested_under=())
+    parsed_area = _parse_area(area.name)
+    if not parsed_area:
+        jdex.errors.append(
+            JDexError(error=_JDEX_INVALID_AREA_NAME, files=[area_file]),
         )
-        cat_re = _valid_category_re(area_match.group(1))
-        with os.scandir(area.path) as cats_it:
-            for cat in cats_it:
-                if _entry_is_ignored(ignored, [area.name], cat):
-                    continue
-                cat_file = File(
-                    name=cat.name,
-                    full_path=cat.path,
-                    nested_under=[area.name],
+        return jdex
+    (area_num, area_name) = parsed_area
+    _insert_use(area_num, area_name, area_file, jdex.areas)
+    with os.scandir(area.path) as cats_it:
+        cat_nested_under = (area.name,)
+        for cat in cats_it:
+            if _entry_is_ignored(ignored, cat_nested_under, cat):
+                continue
+            cat_file = File(
+                name=cat.name,
+                full_path=cat.path,
+                nested_under=cat_nested_under,
+            )
+            if cat.is_file():
+                jdex.errors.append(
+                    JDexError(
+                        error=_JDEX_FILE_OUTSIDE_CATEGORY,
+                        files=[cat_file],
+                    ),
                 )
-                if cat.is_file():
-                    jdex.errors.append(
-                        JDexError(
-                            error=JDexFileOutsideCategory(),
-                            files=[cat_file],
-                        ),
-                    )
-                    continue
+                continue
 
-                if cat_match := cat_re.fullmatch(cat.name):
-                    _insert_append(
-                        cat_match.group(1),
-                        (cat_match.group(2), cat_file),
-                        jdex.categories,
-                    )
-                    id_re = _jdex_note_id_re(cat_match.group(1))
-                    with os.scandir(cat.path) as ids_it:
-                        nested_under = [area.name, cat.name]
-                        for jid in ids_it:
-                            if _entry_is_ignored(ignored, nested_under, jid):
-                                continue
-                            id_file = File(
-                                name=jid.name,
-                                full_path=jid.path,
-                                nested_under=nested_under,
-                            )
-                            if id_match := id_re.fullmatch(jid.name):
-                                _insert_append(
-                                    id_match.group(1),
-                                    (id_match.group(2), id_file),
-                                    jdex.ids,
-                                )
-                            elif gen_match := jdex_note_generic_id_re.fullmatch(
-                                jid.name,
-                            ):
-                                jdex.errors.append(
-                                    JDexError(
-                                        error=JDexIdInWrongCategory(
-                                            id_ac=gen_match.group(1),
-                                            file_ac=cat_match.group(1),
-                                        ),
-                                        files=[id_file],
-                                    ),
-                                )
-                            else:
-                                jdex.errors.append(
-                                    JDexError(
-                                        error=JDexInvalidIDName(),
-                                        files=[id_file],
+            parsed_cat = _parse_category(cat.name)
+            if parsed_cat and parsed_cat[0][0] == area_num:
+                (cat_num, cat_name) = parsed_cat
+                _insert_use(cat_num, cat_name, cat_file, jdex.categories)
+                with os.scandir(cat.path) as ids_it:
+                    nested_under = (area.name, cat.name)
+                    for jid in ids_it:
+                        if _entry_is_ignored(ignored, nested_under, jid):
+                            continue
+                        id_file = File(
+                            name=jid.name,
+                            full_path=jid.path,
+                            nested_under=nested_under,
+                        )
+                        parsed_id = _parse_jdex_note_id(jid.name)
+                        if parsed_id and parsed_id[0][:2] == cat_num:
+                            (id_num, id_name) = parsed_id
+                            _insert_use(id_num, id_name, id_file, jdex.ids)
+                        elif parsed_id:
+                            jdex.errors.append(
+                                JDexError(
+                                    error=JDexIdInWrongCategory(
+                                        id_ac=parsed_id[0][:2],
+                                        file_ac=cat_num,
                                     ),
-                                )
-
-                elif gen_match := generic_category_re.fullmatch(cat.name):
-                    jdex.errors.append(
-                        JDexError(
-                            error=JDexCategoryInWrongArea(
-                                category_area=gen_match.group(1),
-                                file_area=area_match.group(1),
-                            ),
-                            files=[cat_file],
+                                    files=[id_file],
+                                ),
+                            )
+                        else:
+                            jdex.errors.append(
+                                JDexError(
+                                    error=_JDEX_INVALID_ID_NAME,
+                                    files=[id_file],
+                                ),
+                            )
+
+            elif parsed_cat:
+                jdex.errors.append(
+                    JDexError(
+                        error=JDexCategoryInWrongArea(
+                            category_area=parsed_cat[0][0],
+                            file_area=area_num,
                         ),
-                    )
-                else:
-                    jdex.errors.append(
-                        JDexError(error=JDexInvalidCategoryName(), files=[cat_file]),
-                    )
+                        files=[cat_file],
+                    ),
+                )
+            else:
+                jdex.errors.append(
+                    JDexError(
+                        error=_JDEX_INVALID_CATEGORY_NAME,
+                        files=[cat_file],
+                    ),
+                )
+    return jdex
 
 
 def _get_jdex_entries(
@@ -1002,6 +1245,7 @@ def _get_jdex_entries(
     *,
     ignored: list[str] | None,
     alt_zeros: bool = False,
+    jobs: int = 1,
 ) -> _JDexResults | list[JDexError]:
     """Return canonical JDex information or a list of errors for it."""
     if jdex_dir.is_file():
@@ -1010,20 +1254,27 @@ def _get_jdex_entries(
 
     jdex: _JDexAccumulator = _JDexAccumulator()
     root_level_files: list[os.DirEntry] = []
-
-    _process_nested_jdex_structure(jdex_dir, jdex, root_level_files, ignored=ignored)
+    ignore_patterns = _compile_ignored(ignored)
+
+    _process_nested_jdex_structure(
+        jdex_dir,
+        jdex,
+        root_level_files,
+        ignored=ignore_patterns,
+        jobs=jobs,
+    )
 
     if jdex.ids or jdex.errors:
         # Not a flat structure, so we need to add all root level files as invalid
         jdex.errors.extend(
             [
                 JDexError(
-                    error=JDexFileOutsideCategory(),
+                    error=_JDEX_FILE_OUTSIDE_CATEGORY,
                     files=[
                         File(
                             name=f.name,
                             full_path=f.path,
-                            nested_under=[],
+                            nested_under=(),
                         ),
                     ],
                 )
@@ -1036,276 +1287,323 @@ def _get_jdex_entries(
         _process_flat_jdex_structure(
             root_level_files,
             jdex,
-            ignored=ignored,
+            ignored=ignore_patterns,
             alt_zeros=alt_zeros,
         )
 
     # These duplicate errors apply regardless of JDex type
-    jdex.errors.extend(_error_if_dups(JDexDuplicateArea, JDexError, jdex.areas))
     jdex.errors.extend(
-        _error_if_dups(JDexDuplicateCategory, JDexError, jdex.categories),
+        itertools.chain(
+            _error_if_dups(JDexDuplicateArea, JDexError, jdex.areas),
+            _error_if_dups(JDexDuplicateCategory, JDexError, jdex.categories),
+            _error_if_dups(JDexDuplicateId, JDexError, jdex.ids),
+            _error_if_dups(JDexDuplicateAreaHeader, JDexError, jdex.headers),
+        ),
     )
-    jdex.errors.extend(_error_if_dups(JDexDuplicateId, JDexError, jdex.ids))
-    jdex.errors.extend(_error_if_dups(JDexDuplicateAreaHeader, JDexError, jdex.headers))
 
-    for header, files in jdex.headers.items():
+    for header, uses in jdex.headers.items():
         if header not in jdex.areas:
             jdex.errors.append(
                 JDexError(
                     error=JDexAreaHeaderWithoutArea(area=header),
-                    files=[f for (_, f) in files],
+                    files=uses.files,
                 ),
             )
-        elif len(files) == 1 and files[0][0] != jdex.areas[header][0][0]:
+        elif len(uses.files) == 1 and uses.names[0] != jdex.areas[header].names[0]:
             jdex.errors.append(
                 JDexError(
                     error=JDexAreaHeaderDifferentFromArea(
                         area=header,
-                        jdex_name=f"{_print_area(header)} {jdex.areas[header][0][0]}",
+                        jdex_name=(
+                            f"{_print_area(header)} {jdex.areas[header].names[0]}"
+                        ),
                     ),
-                    files=[f for (_, f) in files],
+                    files=uses.files,
                 ),
             )
 
     if jdex.errors:
         return jdex.errors
     return _JDexResults(
-        areas={k: f"{_print_area(k)} {v[0][0]}" for k, v in jdex.areas.items()},
-        categories={k: f"{k} {v[0][0]}" for k, v in jdex.categories.items()},
-        ids={k: f"{k} {v[0][0]}" for k, v in jdex.ids.items()},
+        areas={k: f"{_print_area(k)} {v.names[0]}" for k, v in jdex.areas.items()},
+        categories={k: f"{k} {v.names[0]}" for k, v in jdex.categories.items()},
+        ids={k: f"{k} {v.names[0]}" for k, v in jdex.ids.items()},
     )
 
 
 def lint_dir(
     path: Path,
     ignored: list[str] | None = None,
+    *,
+    jobs: int = 1,
 ) -> LintResults:
     """Check a root of a JD system for issues."""
     errors: list[Error] = []
-    used_areas: dict[str, list[tuple[str, File]]] = {}
-    used_categories: dict[str, list[tuple[str, File]]] = {}
-    used_ids: dict[str, list[tuple[str, File]]] = {}
-
-    def check_inbox(nested_under: list[str], f: os.DirEntry) -> None:
-        if inbox_re.fullmatch(f.name):
-            entries = len(os.listdir(f.path))
-            if entries:
-                errors.append(
-                    Error(
-                        error=NonemptyInbox(num_items=entries),
-                        files=[
-                            File(
-                                name=f.name,
-                                full_path=f.path,
-                                nested_under=nested_under,
-                            ),
-                        ],
-                    ),
-                )
-
-    def check_if_out_of_id(file: os.DirEntry, nested_under: list[str]) -> bool:
-        if file.is_file():
-            errors.append(
-                Error(
-                    error=FileOutsideId(),
-                    files=[
-                        File(
-                            name=file.name,
-                            full_path=file.path,
-                            nested_under=nested_under,
-                        ),
-                    ],
-                ),
-            )
-            return True
-        return False
+    used_areas: dict[str, Uses] = {}
+    used_categories: dict[str, Uses] = {}
+    used_ids: dict[str, Uses] = {}
+    ignore_patterns = _compile_ignored(ignored)
 
+    areas: list[os.DirEntry] = []
     with os.scandir(path) as areas_it:
         for area in areas_it:
-            if _entry_is_ignored(ignored, [], area) or check_if_out_of_id(area, []):
+            if _entry_is_ignored(ignore_patterns, (), area):
                 continue
-            area_file = File(
-                name=area.name,
-                full_path=area.path,
-                nested_under=[],
-            )
-            area_match = valid_area_re.fullmatch(area.name)
-            if not area_match:
-                errors.append(
-                    Error(
-                        error=InvalidAreaName(),
-                        files=[area_file],
-                    ),
-                )
+            if not _check_if_out_of_id(errors, area, ()):
+                areas.append(area)
+
+    for area_results in _map_areas(
+        functools.partial(_lint_area, ignored=ignore_patterns),
+        areas,
+        jobs=jobs,
+    ):
+        errors.extend(area_results.errors)
+        _merge_uses(used_areas, area_results.used_areas)
+        _merge_uses(used_categories, area_results.used_categories)
+        _merge_uses(used_ids, area_results.used_ids)
+
+    errors.extend(
+        itertools.chain(
+            _error_if_dups(DuplicateArea, Error, used_areas),
+            _error_if_dups(DuplicateCategory, Error, used_categories),
+            _error_if_dups(DuplicateId, Error, used_ids),
+        ),
+    )
+    errors.sort(key=_sort_error)
+
+    return LintResults(
+        errors=errors,
+        used_areas=used_areas,
+        used_categories=used_categories,
+        used_ids=used_ids,
+    )
+
+
+def _lint_area(area: os.DirEntry, *, ignored: list[_IgnorePattern]) -> LintResults:
+    """Check a single area folder of a JD system, without checking for duplicates."""
+    errors: list[Error] = []
+    used_areas: dict[str, Uses] = {}
+    used_categories: dict[str, Uses] = {}
+    used_ids: dict[str, Uses] = {}
+
+    area_file = File(name=area.name, full_path=area.path, nested_under=())
+    parsed_area = _parse_area(area.name)
+    if not parsed_area:
+        return LintResults(
+            errors=[Error(error=_INVALID_AREA_NAME, files=[area_file])],
+            used_areas={},
+            used_categories={},
+            used_ids={},
+        )
+    # Valid area
+    (area_num, area_name) = parsed_area
+    _insert_use(area_num, area_name, area_file, used_areas)
+    with os.scandir(area.path) as cats_it:
+        cat_nested_under = (area.name,)
+        for cat in cats_it:
+            if _entry_is_ignored(
+                ignored,
+                cat_nested_under,
+                cat,
+            ) or _check_if_out_of_id(errors, cat, cat_nested_under):
                 continue
-            # Valid area
-            _insert_append(
-                area_match.group(1),
-                (area_match.group(2), area_file),
-                used_areas,
+            cat_file = File(
+                name=cat.name,
+                full_path=cat.path,
+                nested_under=cat_nested_under,
             )
-            cat_re = _valid_category_re(area_match.group(1))
-            with os.scandir(area.path) as cats_it:
-                for cat in cats_it:
-                    if _entry_is_ignored(
-                        ignored,
-                        [area.name],
-                        cat,
-                    ) or check_if_out_of_id(cat, [area.name]):
-                        continue
-                    cat_file = File(
-                        name=cat.name,
-                        full_path=cat.path,
-                        nested_under=[area.name],
-                    )
-                    if cat_match := cat_re.fullmatch(cat.name):
-                        _insert_append(
-                            cat_match.group(1),
-                            (cat_match.group(2), cat_file),
-                            used_categories,
+            parsed_cat = _parse_category(cat.name)
+            if parsed_cat and parsed_cat[0][0] == area_num:
+                (cat_num, cat_name) = parsed_cat
+                _insert_use(cat_num, cat_name, cat_file, used_categories)
+                with os.scandir(cat.path) as ids_it:
+                    nested_under = (area.name, cat.name)
+
+                    for jid in ids_it:
+                        if _entry_is_ignored(
+                            ignored,
+                            nested_under,
+                            jid,
+                        ) or _check_if_out_of_id(errors, jid, nested_under):
+                            continue
+                        id_file = File(
+                            name=jid.name,
+                            full_path=jid.path,
+                            nested_under=nested_under,
                         )
-                        id_re = _valid_id_re(cat_match.group(1))
-                        with os.scandir(cat.path) as ids_it:
-                            nested_under = [area.name, cat.name]
-
-                            for jid in ids_it:
-                                if _entry_is_ignored(
-                                    ignored,
-                                    nested_under,
-                                    jid,
-                                ) or check_if_out_of_id(jid, nested_under):
-                                    continue
-                                id_file = File(
-                                    name=jid.name,
-                                    full_path=jid.path,
-                                    nested_under=nested_under,
-                                )
-                                if id_match := id_re.fullmatch(jid.name):
-                                    _insert_append(
-                                        id_match.group(1),
-                                        (id_match.group(2), id_file),
-                                        used_ids,
-                                    )
-
-                                    check_inbox(nested_under, jid)
-                                elif gen_match := generic_id_re.fullmatch(jid.name):
-                                    errors.append(
-                                        Error(
-                                            error=IdInWrongCategory(
-                                                id_ac=gen_match.group(
-                                                    1,
-                                                ),
-                                                file_ac=cat_match.group(
-                                                    1,
-                                                ),
-                                            ),
-                                            files=[id_file],
-                                        ),
-                                    )
-
-                                else:
-                                    errors.append(
-                                        Error(
-                                            error=InvalidIDName(),
-                                            files=[id_file],
-                                        ),
-                                    )
-                    elif gen_match := generic_category_re.fullmatch(cat.name):
-                        errors.append(
-                            Error(
-                                error=CategoryInWrongArea(
-                                    category_area=gen_match.group(1),
-                                    file_area=area_match.group(1),
+                        parsed_id = _parse_id(jid.name)
+                        if parsed_id and parsed_id[0][:2] == cat_num:
+                            (id_num, id_name) = parsed_id
+                            _insert_use(
+                                id_num,
+                                id_name,
+                                id_file,
+                                used_ids,
+                            )
+
+                            # Check if the ID is an inbox (AC.01)
+                            if id_num[3:] == "01":
+                                _check_inbox(errors, id_file)
+                        elif parsed_id:
+                            errors.append(
+                                Error(
+                                    error=IdInWrongCategory(
+                                        id_ac=parsed_id[0][:2],
+                                        file_ac=cat_num,
+                                    ),
+                                    files=[id_file],
                                 ),
-                                files=[cat_file],
-                            ),
-                        )
-                    else:
-                        errors.append(
-                            Error(
-                                error=InvalidCategoryName(),
-                                files=[cat_file],
-                            ),
-                        )
+                            )
 
-        errors.extend(_error_if_dups(DuplicateArea, Error, used_areas))
-        errors.extend(_error_if_dups(DuplicateCategory, Error, used_categories))
-        errors.extend(_error_if_dups(DuplicateId, Error, used_ids))
+                        else:
+                            errors.append(
+                                Error(
+                                    error=_INVALID_ID_NAME,
+                                    files=[id_file],
+                                ),
+                            )
+            elif parsed_cat:
+                errors.append(
+                    Error(
+                        error=CategoryInWrongArea(
+                            category_area=parsed_cat[0][0],
+                            file_area=area_num,
+                        ),
+                        files=[cat_file],
+                    ),
+                )
+            else:
+                errors.append(
+                    Error(
+                        error=_INVALID_CATEGORY_NAME,
+                        files=[cat_file],
+                    ),
+                )
 
     return LintResults(
-        errors=sorted(errors, key=_sort_error),
+        errors=errors,
         used_areas=used_areas,
         used_categories=used_categories,
         used_ids=used_ids,
     )
 
 
+def _check_inbox(errors: list[Error], f: File) -> None:
+    """Add an error if an inbox ID folder isn't empty."""
+    # Count without building a list of names, since inboxes are usually empty
+    with os.scandir(f.full_path) as inbox_it:
+        entries = sum(1 for _ in inbox_it)
+    if entries:
+        errors.append(
+            Error(
+                error=NonemptyInbox(num_items=entries),
+                files=[f],
+            ),
+        )
+
+
+def _check_if_out_of_id(
+    errors: list[Error],
+    file: os.DirEntry,
+    nested_under: tuple[str, ...],
+) -> bool:
+    """Add an error and return True if a file (rather than a folder) isn't in an ID."""
+    if file.is_file():
+        errors.append(
+            Error(
+                error=_FILE_OUTSIDE_ID,
+                files=[
+                    File(
+                        name=file.name,
+                        full_path=file.path,
+                        nested_under=nested_under,
+                    ),
+                ],
+            ),
+        )
+        return True
+    return False
+
+
 def lint_dir_and_jdex(
     *,
     path: Path,
     jdex_path: Path,
     ignored: list[str] | None = None,
     alt_zeros: bool = False,
+    jobs: int = 1,
 ) -> tuple[list[Error], list[JDexError]]:
     """Check a root of a JD system and its JDex for issues."""
-    results = lint_dir(path, ignored)
-    jdex = _get_jdex_entries(jdex_path, ignored=ignored, alt_zeros=alt_zeros)
+    results = lint_dir(path, ignored, jobs=jobs)
+    jdex = _get_jdex_entries(
+        jdex_path,
+        ignored=ignored,
+        alt_zeros=alt_zeros,
+        jobs=jobs,
+    )
     if isinstance(jdex, list):
-        return (results.errors, sorted(jdex, key=_sort_error))
+        jdex.sort(key=_sort_error)
+        return (results.errors, jdex)
 
     errors = results.errors
 
-    for area, files in results.used_areas.items():
+    for area, uses in results.used_areas.items():
         if area not in jdex.areas:
             errors.append(
                 Error(
                     error=AreaNotInJDex(area=area),
-                    files=[f for (_, f) in files],
+                    files=sorted(uses.files, key=_sort_file),
                 ),
             )
-        elif len(files) == 1 and files[0][1].name != jdex.areas[area]:
+        elif len(uses.files) == 1 and uses.files[0].name != jdex.areas[area]:
             errors.append(
                 Error(
                     error=AreaDifferentFromJDex(
                         area=area,
                         jdex_name=jdex.areas[area],
                     ),
-                    files=[f for (_, f) in files],
+                    files=uses.files,
                 ),
             )
-    for category, files in results.used_categories.items():
+    for category, uses in results.used_categories.items():
         if category not in jdex.categories:
             errors.append(
                 Error(
                     error=CategoryNotInJDex(category=category),
-                    files=[f for (_, f) in files],
+                    files=sorted(uses.files, key=_sort_file),
                 ),
             )
-        elif len(files) == 1 and files[0][1].name != jdex.categories[category]:
+        elif len(uses.files) == 1 and uses.files[0].name != jdex.categories[category]:
             errors.append(
                 Error(
                     error=CategoryDifferentFromJDex(
                         category=category,
                         jdex_name=jdex.categories[category],
                     ),
-                    files=[f for (_, f) in files],
+                    files=uses.files,
                 ),
             )
-    for jid, files in results.used_ids.items():
+    for jid, uses in results.used_ids.items():
         if jid not in jdex.ids:
             errors.append(
-                Error(error=IdNotInJDex(id=jid), files=[f for (_, f) in files]),
+                Error(
+                    error=IdNotInJDex(id=jid),
+                    files=sorted(uses.files, key=_sort_file),
+                ),
             )
-        elif len(files) == 1 and files[0][1].name != jdex.ids[jid]:
+        elif len(uses.files) == 1 and uses.files[0].name != jdex.ids[jid]:
             errors.append(
                 Error(
                     error=IdDifferentFromJDex(id=jid, jdex_name=jdex.ids[jid]),
-                    files=[f for (_, f) in files],
+                    files=uses.files,
                 ),
             )
-    return (sorted(errors, key=_sort_error), [])
+    # Already sorted apart from the JDex errors added above, so sorting again is cheap
+    errors.sort(key=_sort_error)
+    return (errors, [])
 
 
+@functools.cache
 def _print_area(d: str) -> str:
     """Given the number of an area, pretty-print it."""
     return f"{d}0-{d}9"
@@ -1318,6 +1616,19 @@ def _print_nest(f: File) -> str:
     return f.name
 
 
+def _display_annotated(files: list[File], note: str) -> str:
+    """Display the first file of an error, followed by a bracketed note."""
+    return f"{_print_nest(files[0])} [{note}]"
+
+
+_GROUPED_SEP = "\n    "
+
+
+def _display_grouped(header: str, files: list[File]) -> str:
+    """Display a header followed by an indented list of every file of an error."""
+    return header + ":" + _GROUPED_SEP + _GROUPED_SEP.join(map(_print_nest, files))
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
         prog="jdlint",
@@ -1367,6 +1678,14 @@ if __name__ == "__main__":
         const=True,
         help="Specify use of the alternative standard zeros layout; see the README for more info",
     )
+    parser.add_argument(
+        "--jobs",
+        dest="jobs",
+        type=int,
+        metavar="N",
+        default=1,
+        help="Scan up to N areas at once; only faster on slow (e.g. network) drives",
+    )
 
     args = parser.parse_args()
 
@@ -1377,14 +1696,16 @@ if __name__ == "__main__":
             jdex_path=Path(args.jdex),
             ignored=args.ignored,
             alt_zeros=args.altzeros,
+            jobs=args.jobs,
         )
     else:
-        errors = (lint_dir(args.path, args.ignored)).errors
+        errors = (lint_dir(args.path, args.ignored, jobs=args.jobs)).errors
         jdex_errors = []
 
     # Filter disabled errors
-    errors = [e for e in errors if e.type() not in args.disable]
-    jdex_errors = [e for e in jdex_errors if e.type() not in args.disable]
+    disabled = set(args.disable)
+    errors = [e for e in errors if e.error.type not in disabled]
+    jdex_errors = [e for e in jdex_errors if e.error.type not in disabled]
 
     # If there were issues
     if errors or jdex_errors:
@@ -1400,17 +1721,15 @@ if __name__ == "__main__":
         else:
             # Group errors by type and then by type details
             # Since all explanations are identical, there's no reason to print them multiple times
-            jdex_errs_by_type: dict[str, dict[JDexErrorType, list[JDexError]]] = {}
+            jdex_errs_by_type: defaultdict[str, dict[JDexErrorType, list[JDexError]]]
+            jdex_errs_by_type = defaultdict(dict)
             for je in jdex_errors:
-                if je.error.type not in jdex_errs_by_type:
-                    jdex_errs_by_type.update({je.error.type: {}})
-                _insert_append(je.error, je, jdex_errs_by_type[je.error.type])
+                jdex_errs_by_type[je.error.type].setdefault(je.error, []).append(je)
 
-            errs_by_type: dict[str, dict[ErrorType, list[Error]]] = {}
+            errs_by_type: defaultdict[str, dict[ErrorType, list[Error]]]
+            errs_by_type = defaultdict(dict)
             for e in errors:
-                if e.error.type not in errs_by_type:
-                    errs_by_type.update({e.error.type: {}})
-                _insert_append(e.error, e, errs_by_type[e.error.type])
+                errs_by_type[e.error.type].setdefault(e.error, []).append(e)
 
             # Print JDex errors if any
             if jdex_errors:
@@ -4,7 +4,6 @@
 
 from __future__ import annotations
 
-import dataclasses
 import json
 import os
 import unittest
@@ -14,17 +13,22 @@ from typing import Any
 import jdlint
 
 
-def _convert_err(e: jdlint.Error | jdlint.JDexError) -> dict[str, Any]:
-    return {
-        "error": dataclasses.asdict(e.error)  # type: ignore[arg-type]
-        if dataclasses.is_dataclass(e.error)
-        else e.error,
-        "files": [
+def _encode_results(
+    errors: list[jdlint.Error],
+    jdex_errors: list[jdlint.JDexError],
+) -> dict[str, Any]:
+    # Encode exactly as `--json` does, so the encoder is tested as well
+    results = json.loads(
+        json.dumps(
+            {"errors": errors, "jdex_errors": jdex_errors},
+            cls=jdlint._EnhancedJSONEncoder,  # noqa: SLF001
+        ),
+    )
+    for e in results["errors"] + results["jdex_errors"]:
+        for f in e["files"]:
             # Strip full_path, since it's dependent on where we're running the test
-            {"name": f.name, "nested_under": f.nested_under}
-            for f in e.files
-        ],
-    }
+            del f["full_path"]
+    return results
 
 
 class AllTests(unittest.TestCase):
@@ -48,18 +52,22 @@ class AllTests(unittest.TestCase):
                     except FileNotFoundError:
                         ignore = []
 
+                    # Get number of jobs if any
+                    try:
+                        jobs = int(Path(f, "jobs").read_text())
+                    except FileNotFoundError:
+                        jobs = 1
+
                     # Lint the test dir
                     results = jdlint.lint_dir(
                         Path(f, "files"),
                         ignored=ignore,
+                        jobs=jobs,
                     )
                     expected = json.load(golden_file)
 
                     # Convert lint results into loaded format
-                    actual = {
-                        "errors": [_convert_err(e) for e in results.errors],
-                        "jdex_errors": [],
-                    }
+                    actual = _encode_results(results.errors, [])
 
                     # Compare results
                     self.assertEqual(expected, actual)  # noqa: PT009
@@ -82,20 +90,24 @@ class AllTests(unittest.TestCase):
                     except FileNotFoundError:
                         ignore = []
 
+                    # Get number of jobs if any
+                    try:
+                        jobs = int(Path(f, "jobs").read_text())
+                    except FileNotFoundError:
+                        jobs = 1
+
                     # Lint the test dir and JDex
                     (errors, jdex_errors) = jdlint.lint_dir_and_jdex(
                         path=Path(f, "files"),
                         jdex_path=Path(f, "jdex"),
                         ignored=ignore,
                         alt_zeros=Path(f, "altzeros").exists(),
+                        jobs=jobs,
                     )
                     expected = json.load(golden_file)
 
                     # Convert lint results into loaded format
-                    actual = {
-                        "errors": [_convert_err(e) for e in errors],
-                        "jdex_errors": [_convert_err(e) for e in jdex_errors],
-                    }
+                    actual = _encode_results(errors, jdex_errors)
 
                     # Compare results
                     self.assertEqual(expected, actual)  # noqa: PT009